@@ -16,6 +16,9 @@ def UniqueAbbreviation(items):
   # Check for empty list
   if items != None:
 
+    # Set of full item names (quick lookups below)
+    names = set(items)
+
     # Loop through each item in the list
     for item in items:
     
@@ -29,7 +32,7 @@ def UniqueAbbreviation(items):
         if abbrev in unique:
 
           # See if it matches a full item name
-          if abbrev in items:
+          if abbrev in names:
             # It does, set it correctly
             unique[abbrev] = abbrev
           else:
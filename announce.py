@@ -11,13 +11,8 @@
 # character: character to surround it
 # returns    nothing
 def Announce(message, character = '*'):
-  length = len(message)
+  # Header/footer line
+  line = character * (len(message) + 8)
 
-  # Display header line
-  print(character * (length + 8))
-
-  # Display message line
-  print((character * 3) + ' ' + message + ' ' + (character * 3))
-  
-  # Display footer line
-  print(character * (length + 8))
+  # Display header, message and footer lines with a single write
+  print('{0}\n{1} {2} {1}\n{0}'.format(line, character * 3, message))
@@ -16,6 +16,7 @@ from postbios import PostBIOS
 from run      import FilterCommand
 
 bld    = None
+FILTER = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'filter.txt')  # False positive patterns
 
 # Logger for the build command
 class BuildLogger(Logger):
@@ -46,20 +47,22 @@ class BuildLogger(Logger):
   # returns True if real error or warning, False otherwise
   def IsReal(self, which, line, result):
     # Eliminate false positives
-    for regex in self.regex:
-      if regex.search(line): return False
+    if self.regex and self.regex.search(line): return False
     return True
 
   # Loads the regular expressions
   # returns nothing
   def Load(self):
-    self.regex = []
-    filter = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'filter.txt')
-    if os.path.isfile(filter):
-      with open(filter, 'r') as txt:
-        patterns = txt.readlines()
-        for pattern in patterns:
-          self.regex.append(re.compile(pattern.rstrip(), re.IGNORECASE))
+    patterns = []
+    # Just open the filter file (a missing file means there is nothing to filter)
+    try:
+      with open(FILTER, 'r') as txt:
+        for pattern in txt:
+          patterns.append('(?:{0})'.format(pattern.rstrip()))
+    except FileNotFoundError:
+      pass
+    # Combine the filters into one expression (one search per line instead of one per filter)
+    self.regex = re.compile('|'.join(patterns), re.IGNORECASE) if patterns else None
 
   # Processes a line of output
   # line:   Line of output
@@ -115,7 +118,10 @@ def build():
 
   print('Executing: {0}'.format(cmd))
   try:
-    rc      = FilterCommand(cmd, bld.Process, directory)
+    try:
+      rc    = FilterCommand(cmd, bld.Process, directory)
+    finally:
+      bld.Finish()                       # Show final line counts (even if interrupted)
 
     # Send email alert (if enabled)
     if GetAlert():
@@ -1,6 +1,7 @@
 #!/usr/bin/env python
 
 # Standard python modules
+import importlib
 import os
 import sys
 
@@ -26,29 +27,30 @@ Commands      = { }
 class Command:
 
   # Constructor
-  # dir:    Path to command directory
+  # dir:      Path to command directory
+  # needsVcs: True if command must be run in a VCS tree, False otherwise
   # returns nothing
-  def __init__(self, dir):
+  def __init__(self, dir, needsVcs = False):
     assert dir and dir != ''
-    # Import command
-    base = os.path.basename(dir)    # Get name of command
-    sys.path.insert(0,dir)          # Add its directory to the python path
-    exec('import {0}'.format(base)) # Import it!
-    # Load help text from files
-    for key in ('terse', 'details'):
-      with open(os.path.join(dir, COMMAND_FILES[key])) as txt:
-        setattr(self, key, txt.read().strip())
+    # Save location of command
+    # (importing the command and loading its help text are put off until needed
+    #  since only one command is used per invocation)
+    self.dir  = dir
+    self.base = os.path.basename(dir) # Get name of command
+    self.code = None
+    self.help = {}                    # Help text loaded so far (by level)
     # Indicate need for presence in VCS tree
-    setattr(self, "needsVcs", os.path.isfile(os.path.join(dir, NEEDS_VCS)))
-    # Set up execution
-    cmd = 'self.code = {0}.{0}'.format(base)
-    exec(cmd)
+    self.needsVcs = needsVcs
 
   # Processing command specific help
   # level:  Level of help needed (terse or details)
   # returns help text
   def Help(self, level):
-    return getattr(self, level)
+    # Load help text from file (first time only)
+    if level not in self.help:
+      with open(os.path.join(self.dir, COMMAND_FILES[level])) as txt:
+        self.help[level] = txt.read().strip()
+    return self.help[level]
 
   # Indicates command need for VCS
   # returns True if command needs VCS, False otherwise
@@ -58,20 +60,30 @@ class Command:
   # Runs the command
   # returns nothing
   def Run(self):
+    # Import command (first time only)
+    if not self.code:
+      sys.path.insert(0, self.dir)    # Add its directory to the python path
+      module    = importlib.import_module(self.base)
+      self.code = getattr(module, self.base)
     self.code()
 
 # Gets command information
 # cmd: Command to be loaded
 # returns command
 def GetCommand(cmd):
-  # Only interested in directories
+  # Get contents of command directory
+  # (one directory read rather than checking for each file separately)
   dir = os.path.join(data.gbl.cmdDir, cmd)
-  if (not os.path.isdir(dir)): return None
+  try:
+    with os.scandir(dir) as entries:
+      files = {entry.name for entry in entries if entry.is_file()}
+  except OSError:
+    return None
   # Must have help files and code
   COMMAND_FILES['code'] = cmd + '.py'
   for key in COMMAND_FILES:
-    if (not os.path.isfile(os.path.join(dir, COMMAND_FILES[key]))): return None
-  return Command(dir)
+    if (not COMMAND_FILES[key] in files): return None
+  return Command(dir, NEEDS_VCS in files)
 
 # Gets command name from possilbe abbreviation
 # command: Potentailly abbreviated command
@@ -114,8 +126,9 @@ def ShowDetailedHelp():
 # returns Nothing
 def LoadCommands():
   global Abbreviate, Command
-  # Get contents of command directory
-  lst = os.listdir(data.gbl.cmdDir)
+  # Get contents of command directory (only interested in directories)
+  with os.scandir(data.gbl.cmdDir) as entries:
+    lst = [entry.name for entry in entries if entry.is_dir()]
   # Loop through list of potential commands
   for cmd in lst:
     # Add valid command to the command table
@@ -13,6 +13,12 @@ from error    import ErrorMessage, UsageError
 
 rePath = re.compile('([a-z]:)?', re.IGNORECASE)
 
+# Accepted values for on/off items (mapped to the value that is saved)
+ON_OFF = {
+  '': 'off', 'off': 'off', 'disabled': 'off', 'false': 'off', 'no': 'off', 'none': 'off',
+  'on': 'on', 'enabled': 'on', 'true': 'on', 'yes': 'on',
+}
+
 # Display the value of an BIOSTool setting
 # item:  Setting to be displayed
 # local: True if it is a local setting, False if it is a global setting
@@ -127,13 +133,10 @@ def SetItem(item, local, readonly, value):
 
     # Validate on/off items
     if item in ('alert', 'release', 'warnings'):
-      if   value in ['', 'off', 'disabled', 'false', 'no', 'none']:
-        value = 'off'
-      elif value in ['on', 'enabled', 'true', 'yes']:
-        value = 'on'
-      else:
+      if not value in ON_OFF:
         ErrorMessage('Unsupported setting for local.{0}: {1}'.format(item, value))
         # DOES NOT RETURN
+      value = ON_OFF[value]
 
     # Validate path items
   #  elif item in ('compare', 'editor', 'hdt', 'lauterbach', 'tagger'):
@@ -178,35 +181,22 @@ def SetItem(item, local, readonly, value):
 
 def GetItemInfo(item):
   try:
-    # Start with empty lists
-    normalSettings   = []
-    readonlySettings = []
-    globalSettings   = []
-    allSettings      = []
-    
-    # Add global items
-    normalSettings   += data.gbl.items
-    readonlySettings += data.gbl.readonly
-    globalSettings   += data.gbl.items + data.gbl.readonly
-    allSettings      += globalSettings
-
-    # Add local items (if any)
-    if data.lcl:
-      normalSettings   += data.lcl.items
-      readonlySettings += data.lcl.readonly
-      allSettings      += data.lcl.items + data.lcl.readonly
+    # Classify each setting as (isLocal, isReadonly) in a single pass
+    # (local items first so that global items take precedence)
+    settings = {}
+    for obj, isLocal in ((data.lcl, True), (data.gbl, False)):
+      if not obj: continue
+      for name in obj.items:    settings[name] = (isLocal, False)
+      for name in obj.readonly: settings[name] = (isLocal, True)
 
     # Create abbreviation dictionary
-    abbreviate = UniqueAbbreviation(allSettings)
+    abbreviate = UniqueAbbreviation(settings)
 
     # Determine configurable item name,
     item = abbreviate[item]
 
-    # Determine global status
-    isLocal = not item in globalSettings
-
-    # Determine readonly status
-    isReadonly = item in readonlySettings
+    # Determine global and readonly status
+    isLocal, isReadonly = settings[item]
 
     # Return resuls
     return (item, isLocal, isReadonly)
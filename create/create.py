@@ -9,7 +9,8 @@ import data
 from announce import Announce
 from error    import ErrorMessage, UsageError
 from cmdline  import ParseCommandLine
-from postbios import PostBIOS
+from misc     import TO_SLASH
+from postbios import PostBIOS, Quote
 from run      import DoCommand
 from vcs      import GetVCSInfo, DoesBranchExist
 
@@ -41,7 +42,7 @@ def create():
     # DOES NOT RETURN
 
   # Get parameters (with defaults)
-  Branch    = Prms[0].replace("\\", "/") # Enforce that branches have slashes not backslashes
+  Branch    = Prms[0].translate(TO_SLASH) # Enforce that branches have slashes not backslashes
   Worktree  = Prms[1]
   Abstree   = os.path.abspath(Worktree)
   Commitish = "HEAD" if len(Prms) < 3 else Prms[2]
@@ -80,7 +81,7 @@ def create():
     # DOES NOT RETURN
 
   # Get command for creating worktree
-  cmd  = 'git worktree add -b {0} {1} {2}'.format(Branch, Abstree, Commitish)
+  cmd  = 'git worktree add -b {0} {1} {2}'.format(Branch, Quote(Abstree), Commitish)
   # Perform create operation
   rc = DoCommand('Creating worktree', 'Create Worktree', cmd, Repo)
   if rc:
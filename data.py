@@ -7,25 +7,25 @@ import sys
 # Local modules
 import data
 from   error      import ErrorMessage
-from   run        import FilterCommand
-from   misc       import FixPath, FixStr
+from   misc       import FixPath
 from   vcs        import AutoSelectRepo, SetWorktree, FindWorkTreeFromPartialPath
 
 # Global constants
 SETTINGS_DIRECTORY = '.bt'
+TOOL_DIRECTORY     = os.path.dirname(os.path.abspath(__file__))   # Resolved once (abspath calls getcwd)
+
+# Supported execution environments (keyed by sys.platform)
+SUPPORTED_PLATFORMS = {
+  'linux':  'Linux',
+  'linux2': 'Linux',
+  'darmin': 'OS X',
+  'win32':  'Windows',
+}
 
 # Global variables
 gbl    = None       # For holding BIOS tool global settings
 lcl    = None       # For holding BIOS tool local  settings
 info   = None       # For holding VCS  information
-Output = []         # For holding command output
-
-# Add line to output
-# line:   Line of text to be added
-# retruns nothing
-def KeepLines(line):
-  global Output
-  Output.append(line)
 
 # A class for holding and modifying BIOS tool settings
 class BIOSSettings:
@@ -39,24 +39,36 @@ class BIOSSettings:
     assert possible and type(possible) is str
     # Save givens
     self.base     = base
-    self.possible = os.path.join(os.path.dirname(os.path.abspath(__file__)), possible)
+    self.possible = os.path.join(TOOL_DIRECTORY, possible)
     # Handle case where setting file does not exist
-    if not os.path.isfile(self.possible): return
-    # Load current settings
-    self.items    = []
-    self.readonly = []
-    self.prompt   = {}
-    with open(self.possible) as possible:   # Get possible settings from file
-      for line in possible.readlines():     # Loop through each setting
+    try:
+      txt = open(self.possible)
+    except FileNotFoundError:
+      return
+    with txt:
+      # Load current settings
+      self.items    = []
+      self.readonly = []
+      self.prompt   = {}
+      self.saved    = {}                    # Values as last read from or written to disk
+      self.present  = set()                 # Setting files that exist on disk
+      # Learn which settings have been saved with a single directory read
+      # (so only files that exist get opened)
+      try:
+        with os.scandir(self.base) as entries:
+          self.present = {entry.name for entry in entries if entry.is_file()}
+      except OSError:
+        pass
+      for line in txt:                      # Get possible settings from file
         item = line.strip()
         if item[0] == '*':                  # Readonly?
           items = item[1:].split(',')
           item  = items[0].strip()
           self.readonly.append(item)        # Add to readonly setting
           self.prompt[item] = '' if len(items) == 1 else items[1].strip()
-        else:                             # Handle read/write settings
+        else:                               # Handle read/write settings
           self.items.append(item)
-        self.GetItem(item)                # Get setting value
+        self.GetItem(item)                  # Get setting value
 
   # Get a configuration setting item
   # item:   Item to get
@@ -65,17 +77,21 @@ class BIOSSettings:
     assert item and ((item in self.items) or (item in self.readonly))
     # Assume unset
     value = ''
-    # Already loaded?
-    if hasattr(self, item):
+    # Already loaded? (saved holds every item read or written so far, a dictionary
+    # lookup is cheaper than hasattr which raises internally for missing items)
+    if item in self.saved:
       # Get loaded value
       value = getattr(self, item)
     else:
-      # Setting file exist?
-      name = os.path.join(self.base, item)
-      if (os.path.isfile(name)):
-        # Get value from file
-        with open(name, 'r') as file:
-          value = file.read()
+      # Get value from file (a missing file just means the item is unset)
+      if item in self.present:
+        name = os.path.join(self.base, item)
+        try:
+          with open(name, 'r') as file:
+            value = file.read()
+        except OSError:
+          pass
+      self.saved[item] = value
     setattr(self, item, value)
     return value
 
@@ -87,13 +103,38 @@ class BIOSSettings:
     assert item and ((item in self.items) or (item in self.readonly))
     # Set attribute value of item
     setattr(self, item, value)
+    # Nothing to save if the file already holds this value
+    if item in self.saved and self.saved[item] == value: return
     # Save value to file
     if not os.path.isdir(self.base):
       # Make directory
       os.mkdir(self.base)
     name = os.path.join(self.base, item)
-    with open(name, 'w') as file:
+    # Write a temporary file and move it into place
+    # (so an interrupted write never leaves a truncated setting behind)
+    temp = name + '.tmp'
+    with open(temp, 'w') as file:
       file.write(value)
+    os.replace(temp, name)
+    # Remember value only once it is on disk
+    self.saved[item] = value
+    self.present.add(item)
+
+  # Remove a configuration setting item
+  # item:   Item to remove
+  # returns nothing
+  def RemoveItem(self, item):
+    assert item and ((item in self.items) or (item in self.readonly))
+    # Item is now unset
+    setattr(self, item, '')
+    self.saved[item] = ''
+    # Remove file (only when there is one)
+    if item in self.present:
+      try:
+        os.remove(os.path.join(self.base, item))
+      except FileNotFoundError:
+        pass
+      self.present.discard(item)
 
 # Gets the indicated setting
 # obj:    Object from which to get the setting
@@ -114,23 +155,16 @@ def GetSetting(obj, name, msg):
 # Get settings
 # returns Nothing
 def InitializeSettings():
-  global Output
-
   # Determine execution environment
-  supported ={
-    'linux':  'Linux',
-    'linux2': 'Linux',
-    'darmin': 'OS X',
-    'win32':  'Windows',
-  }
   platform = sys.platform
-  if platform not in supported:
+  if platform not in SUPPORTED_PLATFORMS:
     ErrorMessage(f'Unsuppored plattfom: {platform}')
-  platform = supported[platform]
+  platform = SUPPORTED_PLATFORMS[platform]
 
   # Detect if running WSL
+  # (same check as "uname -a | grep WSL" without starting a shell and two processes)
   if platform == 'Linux':
-    platform = 'Linux' if os.system('uname -a | grep "WSL"') else 'WSL' 
+    platform = 'WSL' if 'WSL' in ' '.join(os.uname()) else 'Linux'
 
   # Get user's home directory
   env  = 'USERPROFILE' if platform == 'Windows' else 'HOME'
@@ -141,7 +175,7 @@ def InitializeSettings():
 
   # Load global settings
   data.gbl          = data.BIOSSettings(os.path.join(home, SETTINGS_DIRECTORY), 'global.txt')
-  data.gbl.cmdDir   = os.path.dirname(os.path.abspath(__file__))
+  data.gbl.cmdDir   = TOOL_DIRECTORY
   data.gbl.program  = os.path.splitext(os.path.basename(sys.argv[0]))[0].lower()
   data.gbl.platform = platform
 
@@ -151,36 +185,57 @@ def InitializeSettings():
 
   # Get repositories
   selected           = False  # Assume selected repo is not found in available repos
-  if hasattr(data.gbl, 'repositories'):
+  repositories       = data.gbl.GetItem('repositories')
+  if repositories:
     # Split into individual repos
-    repos = data.gbl.repositories.split(';')
+    repos = repositories.split(';')
+    seen  = set()     # Repos already handled
     # Loop through repos
     for repo in repos:
-      # Make sure directory exists and has a VCS repository
+      # Skip repeated entries (each repo only needs to be checked once)
       repo = repo.lower()
-      if os.path.isdir(repo):
-        # Handle svn repo
-        if os.path.isdir(os.path.join(repo, '.svn')):
-          data.gbl.repos.append(repo)                         # Add repository to list
-        # Handle git repo
-        elif os.path.isdir(os.path.join(repo, '.git')):
-          data.gbl.repos.append(repo)                         # Add repository to list
-          # Get worktrees within repo
-          Output = []                                         # Start with no output
-          FilterCommand('git worktree list', KeepLines, repo) # Get list of worktrees
-          if Output:                                          # Make sure worktree(s) were found
-            for line in Output[1:]:                           # Don't include repo in worktree list
-              parts = line.split()                            # Split worktree info
-              name = FixStr(parts[0].lower())                 # Get worktree name
-              name = FixPath(name)
-              data.gbl.worktrees.append(name)                 # Add worktree to list
-        # Handle mistaken repo
-        else:
-          continue
-        # Update selected (if found)
-        if data.gbl.repo != None:
-          if repo == data.gbl.repo:
-            selected = True                                   # Match for selected repo found
+      if repo in seen: continue
+      seen.add(repo)
+      # Make sure directory exists and has a VCS repository
+      # (one directory read finds both possible VCS directories)
+      try:
+        with os.scandir(repo) as entries:
+          found = [entry.name for entry in entries if entry.name in ('.svn', '.git') and entry.is_dir()]
+      except OSError:
+        continue
+      # Handle svn repo
+      if '.svn' in found:
+        data.gbl.repos.append(repo)                         # Add repository to list
+      # Handle git repo
+      elif '.git' in found:
+        data.gbl.repos.append(repo)                         # Add repository to list
+        # Get worktrees within repo
+        # (git keeps a gitdir file for each worktree holding the path of the worktree's
+        #  .git file, reading those avoids starting "git worktree list" for every repo)
+        try:
+          with os.scandir(os.path.join(repo, '.git', 'worktrees')) as entries:
+            gitdirs = [os.path.join(entry.path, 'gitdir') for entry in entries if entry.is_dir()]
+        except OSError:
+          gitdirs = []                                      # Repo has no worktrees
+        for gitdir in gitdirs:
+          try:
+            with open(gitdir, 'r') as file:
+              name = file.readline().strip()
+          except OSError:
+            continue
+          # Path may be relative to the worktree's directory within .git
+          # (git 2.48+ with worktree.useRelativePaths)
+          name = os.path.join(os.path.dirname(gitdir), name)
+          name = os.path.dirname(os.path.normpath(name)).lower()
+          name = FixPath(name)
+          data.gbl.worktrees.append(name)                   # Add worktree to list
+      # Handle mistaken repo
+      else:
+        continue
+      # Update selected (if found)
+      if data.gbl.repo != None:
+        if repo == data.gbl.repo:
+          selected = True                                   # Match for selected repo found
 
   # Handle case where selected repo not found
   if not selected:
@@ -201,10 +256,10 @@ def InitializeSettings():
 # Keeps track of the last worktree used
 # returns nothing
 def SetLast():
-  last = os.path.join(data.gbl.base,'last')
   if data.gbl.worktree:
-    with open(last, 'w') as file:
-      file.write('{0}, {1}'.format(os.path.dirname(data.gbl.worktree), os.path.basename(data.gbl.worktree)))
+    # Split worktree into its parent and name in one pass
+    parent, name = os.path.split(data.gbl.worktree)
+    # (file is only rewritten when the last worktree changes)
+    data.gbl.SetItem('last', '{0}, {1}'.format(parent, name))
   else:
-    if os.path.isfile(last):
-      os.remove(last)
+    data.gbl.RemoveItem('last')
@@ -8,7 +8,7 @@ import sys
 import data
 from cmdline  import ParseCommandLine
 from error    import ErrorMessage
-from postbios import PostCMD, PostBIOS
+from postbios import PostCMD, PostBIOS, Quote
 from run      import DoCommand
 from vcs      import GetVCSInfo
 
@@ -49,7 +49,7 @@ def destroy():
       cmds += [repo[0:2], 'cd {0}'.format(repo)]
 
     # Add command for removing a worktree
-    cmd  = 'git worktree remove --force {0}'.format(worktree)
+    cmd  = 'git worktree remove --force {0}'.format(Quote(worktree))
     cmds += PostCMD(cmd, 'Removing worktree', 'Destroy Worktree')
 
     # Handle removal of associate branch (unless instructed to leave it)
@@ -17,15 +17,15 @@ operators = [ '//', '**', '&&', '||', '==', '!=', '<>', '>=', '=>', '<=', '=<',
               '+',  '-',  '*',  '/',  '%',  '^',  '&',  '|',  '>',  '<',  '(',  ')',  '!',  '~' ]
 
 # Build delimiter regular expression from operators
-reDelims = ''               # Start with empty string
-sep      = ''               # Start with no seperator
-for delim in operators:     # Loop through operators
-    reDelims += sep + delim # Add operator and seperator
-    sep      = ' '          # Change serperator to space
+# (joined in one step rather than concatenated one operator at a time)
+reDelims = ' '.join(operators)
 # Add escape to characters for operators that need it
 reDelims = re.sub('(\*|\||\+|\-|\^|\(|\))', '\\\\\g<1>', reDelims)
 # Make delimiter regular expression a big OR
 reDelims = '(' + re.sub(' ', '|', reDelims) + ')'
+# Compile the patterns used to split up lines (once rather than on every split)
+reDelims = re.compile(reDelims)
+reSpaces = re.compile('(\s+)')
 
 # Classes: List of names of classes associated with the operators
 # (must be listed in same order as operators)
@@ -605,12 +605,9 @@ class Operations(Term):
                     lOperator = OpLeftParenthesis()
                     rOperator = OpRightParenthesis()
                     operation = Operation(lOperator, operations, rOperator)
-                    # Rebuild operations with parenthetical operation in correct position
-                    operations = [] if left == 0 else self.operations[0:left]
-                    operations.append(operation)
-                    if index < len(self.operations):
-                        for remaining in self.operations[index + 1:]: operations.append(remaining)
-                    self.operations = operations
+                    # Replace parenthesis and their contents with the parenthetical operation
+                    # (in place rather than rebuilding the whole list)
+                    self.operations[left:index + 1] = [operation]
                     # Upate index and maximum length
                     index = left
                     maxx  = len(self.operations)
@@ -629,7 +626,7 @@ class Operations(Term):
         while index < maxx:
             operation = self.operations[index]
             # Reduce targetOperations in parenthetical isolations
-            if hasattr(operation, 'left') and isinstance(operation.left, OpLeftParenthesis):
+            if isinstance(getattr(operation, 'left', None), OpLeftParenthesis):
                 operation.operator.Reduce(targetOperation, useLeft)
                 index += 1
                 continue
@@ -645,14 +642,10 @@ class Operations(Term):
             assert maxx > index, 'No right token for {0}'.format(targetOperation)
             right = self.operations[index + 1]
             # Create operation
-            line = targetOperation + '()'
-            operation = Operation(left, eval(line), right)
+            operation = Operation(left, opNamed[targetOperation](), right)
             # Update operations array appropriately
-            operations = [] if index < 2 else self.operations[0:index - 1]
-            operations.append(operation)
-            if maxx > index + 2:
-                for remaining in self.operations[index + 2:]: operations.append(remaining)
-            self.operations = operations
+            # (in place rather than rebuilding the whole list)
+            self.operations[max(index - 1, 0):index + 2] = [operation]
             # Upate for next loop iteration
             maxx  = len(self.operations)
             # Don't update index (already updated ... for left, operator and right colapsed into one)
@@ -664,6 +657,14 @@ class Operations(Term):
             result = operation.Evaluate(dictionary)
         return result
 
+# Operator classes keyed by operator
+# (built once so each token needs only a single dictionary lookup)
+opClasses = dict(zip(operators, [globals()[name] for name in classes]))
+
+# Operator classes keyed by class name
+# (so operations can be created without compiling and evaluating a string)
+opNamed   = {name: globals()[name] for name in priority}
+
 # Evaluator of a string
 # local - variable definitions to use
 def Evaluator(string, local):
@@ -681,17 +682,15 @@ def Evaluator(string, local):
 
 # Tokenize a string
 def Tokenize(string):
-    global operators, classes
+    global opClasses
     # Start with no tokens
     #print(string)
     tokens = []
     # Split line into tokens
     for token in Splitter(string):
         # Handle operators
-        if token in operators:
-            idx = operators.index(token)
-            op  = eval(classes[idx])
-            tokens.append(op())
+        if token in opClasses:
+            tokens.append(opClasses[token]())
         else:
             try:
                 # The token is a constant if it is an Number, Boolean or String
@@ -703,10 +702,10 @@ def Tokenize(string):
 
 # Split up a line of text into tokens
 def Splitter(line):
-  global reDelims
+  global reDelims, reSpaces
   # Ensure all delimiters are separated by spaces
-  line = re.sub(reDelims, ' \g<1> ', line)
+  line = reDelims.sub(' \g<1> ', line)
   # Now replace multiple-space gaps with single spaces
-  line = re.sub('(\s+)',  ' ', line)
+  line = reSpaces.sub(' ', line)
   # Now return the split up line
   return line.split()
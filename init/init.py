@@ -24,6 +24,41 @@ PRODUCT_PATHS = [
   'HpPlatforms',                          # Gen 10/9
 ]
 
+# Search a directory tree for a subdirectory
+# base:   top of directory tree to be searched
+# target: lowercase name of subdirectory to find
+# returns path to subdirectory or None if not found
+def FindDirectory(base, target):
+  # Only directories are examined and the file type cached by scandir is used
+  # instead of stat'ing every entry.  The tree is searched one level at a time so
+  # a shallow platform package is found without first descending into the (deep)
+  # source trees of every other package.
+  level = [base]
+  while level:
+    below = []
+    for current in level:
+      found = SearchDirectory(current, target, below)
+      if found: return found
+    level = below
+  return None
+
+# Search one directory for a subdirectory
+# current: directory to be searched
+# target:  lowercase name of subdirectory to find
+# below:   list to which subdirectories to be searched later are added
+# returns path to subdirectory or None if not found
+def SearchDirectory(current, target, below):
+  try:
+    with os.scandir(current) as entries:
+      subdirs = [entry for entry in entries if entry.is_dir()]
+  except OSError:
+    return None
+  for entry in subdirs:
+    if entry.name.lower() == target: return entry.path
+  # Search deeper later (skipping links and hidden directories such as .git)
+  below.extend(entry.path for entry in subdirs if not entry.name.startswith('.') and not entry.is_symlink())
+  return None
+
 # Find the platform package
 # top:      top of tree
 # platform: platform name
@@ -33,45 +68,25 @@ def FindPlatformPackage(top, platform):
   # Find platform package directory
   target = platform.lower() + 'pkg'
   for path in PRODUCT_PATHS:
-    if data.gbl.platform == 'Windows':
-      path = path.replace('/', '\\')  # Fix slashes
-    base = os.path.join(top, path)
-    for rootdir, dirs, files in os.walk(base):
-      for subdir in dirs:
-        if subdir.lower() == target: return os.path.join(rootdir, subdir)
+    base = os.path.join(top, *path.split('/'))  # Join with the native separator
+    found = FindDirectory(base, target)
+    if found: return found
   return None
 
-# Determine the type of AMD CPU
-# platform: full path to platform package
-# returns the AMD CPU name (e.g. milan)
-# DOES NOT RETURN IF THERE IS AN ERROR
-def GetAmdCpu(platform):
-  try:
-    with open(os.path.join(platform,"PlatformPkgBuildArgs.txt"),'r') as f:
-      lines = f.readlines()
-      for line in lines:
-        if not line.startswith('-D CPUTARGET='): continue
-        return line.replace('-D CPUTARGET=','').strip().lower()
-      else:
-        ErrorMessage('Unable to autodetect AMD CPU type')
-        # DOES NOT RETURN
-  except FileNotFoundError:
-    ErrorMessage('PlatformPkgBuildArgs.txt not found in platform package directory')
-    # DOES NOT RETURN
-
-# Determine the type of Arm CPU
+# Determine the type of AMD or Arm CPU
 # platform: full path to platform package
-# returns the Arm CPU name (e.g. Ampere Pro)
+# vendor:   CPU vendor name for messages (e.g. AMD)
+# returns the CPU name (e.g. milan)
 # DOES NOT RETURN IF THERE IS AN ERROR
-def GetArmCpu(platform):
+def GetBuildArgsCpu(platform, vendor):
   try:
     with open(os.path.join(platform,"PlatformPkgBuildArgs.txt"),'r') as f:
-      lines = f.readlines()
-      for line in lines:
+      # Read line by line (stops reading once the CPU is found)
+      for line in f:
         if not line.startswith('-D CPUTARGET='): continue
         return line.replace('-D CPUTARGET=','').strip().lower()
       else:
-        ErrorMessage('Unable to autodetect Arm CPU type')
+        ErrorMessage('Unable to autodetect {0} CPU type'.format(vendor))
         # DOES NOT RETURN
   except FileNotFoundError:
     ErrorMessage('PlatformPkgBuildArgs.txt not found in platform package directory')
@@ -84,8 +99,8 @@ def GetArmCpu(platform):
 def GetIntelCpu(platform):
   try:
     with open(os.path.join(platform,'PlatformPkg.dsc'),'r') as f:
-      lines = f.readlines()
-      for line in lines:
+      # Read line by line (stops reading once the CPU is found)
+      for line in f:
         line = line.strip()
         if not line.startswith('DEFINE'): continue
         items = line.split()
@@ -112,11 +127,11 @@ def AutoDetect(top, name):
   # See if it is AMD
   if name[0] == 'A':
     vendor = 'amd'
-    cpu    = GetAmdCpu(platform)
+    cpu    = GetBuildArgsCpu(platform, 'AMD')
     # Does not return if CPU cannot be determined
   elif name[0] == 'R':
     vendor = 'arm'
-    cpu    = GetArmCpu(platform)
+    cpu    = GetBuildArgsCpu(platform, 'Arm')
     # Does not return if CPU cannot be determined
   else:
     vendor = 'intel'
@@ -3,14 +3,26 @@
 # Standard python modules
 import sys
 import re
+import time
 
 # Local modules
 # None
 
 DEBUG = 0
 
+PROGRESS_INTERVAL = 0.1   # Minimum seconds between progress line updates
+
+# Counts lines, errors and warnings in command output while showing a progress line
+# (progress updates are throttled so Finish must be called once the output has
+#  been processed to show the final counts)
 class Logger:
 
+  # Regular expression search patterns (compiled once for all loggers)
+  reQuickWarn  = re.compile(r'(^|\b)(error|fail|warn)', re.IGNORECASE)
+  reQuickError = re.compile(r'(^|\b)(error|fail)', re.IGNORECASE)
+  reError      = re.compile(r'\b(errors)|(error)|(failures)|(failure)|(failed)|(fail)\b', re.IGNORECASE)
+  reWarn       = re.compile(r'\b(warnings)|(warning)|(warned)|(warn)\b', re.IGNORECASE)
+
   # Constructor
   # log:    Logfile name
   # task:   Current task
@@ -24,15 +36,12 @@ class Logger:
     self.lines    = 0
     self.errors   = 0
     self.warnings = 0
-    # Initialize regular expression search patterns
-    self.reQuick  = re.compile(r'(^|\b)(error|fail|warn)' if warn else r'(^|\b)(error|fail)',re.IGNORECASE)
-    self.reError  = re.compile(r'\b(errors)|(error)|(failures)|(failure)|(failed)|(fail)\b', re.IGNORECASE)
-    self.reWarn   = re.compile(r'\b(warnings)|(warning)|(warned)|(warn)\b', re.IGNORECASE)
-    # Initialize inline show code (needed because of python V2/V3 differences)
-    if (sys.version_info > (3, 0)):
-      self.show   = "print(msg, end = '')"
-    else:
-      self.show   = "print(msg),"
+    # Select quick search pattern
+    self.reQuick  = self.reQuickWarn if warn else self.reQuickError
+    # Build progress line format once (task and warning column never change)
+    self.progress = '\r{0}: Lines {{0}}, Errors {{1}}'.format(task) + (', Warnings {2}' if warn else '')
+    self.length   = 0       # Length of last progress line shown
+    self.shown    = None    # Time last progress line was shown (None to show on next line)
     # Open log file
     self.log      = open(log, 'w') if log else None
 
@@ -57,6 +66,23 @@ class Logger:
     if (length < self.length): output += ' ' * (self.length - length)
     # Show the line
     print('\r{0}: {1}'.format(prefix, output))
+    # Progress line was overwritten, make sure it gets shown again
+    self.shown = None
+
+  # Shows the progress line
+  # returns nothing
+  def Show(self):
+    msg = self.progress.format(self.lines, self.errors, self.warnings)
+    self.length = len(msg)
+    # Write progress line directly (works on python V2 and V3 without compiling code per line)
+    sys.stdout.write(msg)
+    self.shown = time.monotonic()
+
+  # Shows the final progress line
+  # (call once the output has been processed as updates are throttled)
+  # returns nothing
+  def Finish(self):
+    self.Show()
 
   # Processes a captured line of output
   # line:   Line of output
@@ -93,6 +119,7 @@ class Logger:
             self.Print('*** WARNING ***', line)
           elif (DEBUG): print('warning filtered!')
         elif (DEBUG): print('warning search: no match!')
-    msg = '\r{0}: Lines {1}, Errors {2}{3}'.format(self.task, self.lines, self.errors, ', Warnings {0}'.format(self.warnings) if self.warn else '')
-    self.length = len(msg)
-    exec(self.show)
+    # Update progress line (limited to every PROGRESS_INTERVAL seconds since writing
+    # it for every line of a large build costs more than the build output handling)
+    if self.shown is None or time.monotonic() - self.shown >= PROGRESS_INTERVAL:
+      self.Show()
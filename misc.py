@@ -9,13 +9,20 @@ import data
 from   error import ErrorMessage
 from   run   import RunCommand
 
+# Translation tables for converting path separators in a single pass
+TO_BACKSLASH = str.maketrans('/', '\\')
+TO_SLASH     = str.maketrans('\\', '/')
+
+# Python version only needs to be checked once
+PY3          = sys.version_info > (3, 0)
+
 ipv4 = re.compile('^(?:25[0-5]|2[0-4][0-9]|[01]?[0-9][0-9]?)\\.(?:25[0-5]|2[0-4][0-9]|[01]?[0-9][0-9]?)\\.(?:25[0-5]|2[0-4][0-9]|[01]?[0-9][0-9]?)\\.(?:25[0-5]|2[0-4][0-9]|[01]?[0-9][0-9]?)$')
 
 # Fixup a string
 # item:   String to be fixed
 # returns Fixed-up string
 def FixStr(item):
-  if sys.version_info > (3, 0):
+  if PY3:
     return str(item, 'utf-8')
   return item
 
@@ -24,7 +31,7 @@ def FixStr(item):
 # returns Fixed-up string
 def FixPath(path):
   if data.gbl.platform == 'Windows':
-    path = path.replace('/', '\\')          # Replace slashes with backslashes
+    path = path.translate(TO_BACKSLASH)     # Replace slashes with backslashes
   return path
 
 # Return the build type indicated by the local setting releae
@@ -9,7 +9,7 @@ import data
 from error    import ErrorMessage, UsageError
 from cmdline  import ParseCommandLine
 from misc     import FixPath
-from postbios import PostBIOS
+from postbios import PostBIOS, Quote
 from vcs      import GetVCSInfo
 
 # Global constants
@@ -75,7 +75,7 @@ def move():
 
   # Generate commands that will move the worktree
   cmds += ['echo Moving worktree from {0} to {1}'.format(Work, Dest),
-           'git worktree move {0} {1}'.format(Work, Dest)]
+           'git worktree move {0} {1}'.format(Quote(Work), Quote(Dest))]
 
   # Handle CD after worktree move (if needed)
   if needsCd:
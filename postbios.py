@@ -9,6 +9,18 @@ import os
 POSTCMD = 'postbt.cmd'
 Counter = 1
 
+# Quotes an argument for a Windows command line (only when needed)
+# (used for the post execution script and for commands run directly)
+# arg:    Argument to be quoted
+# returns argument as is or surrounded with quotes if it contains whitespace
+def Quote(arg):
+  assert type(arg) is str
+  if not (' ' in arg or '\t' in arg): return arg
+  # Trailing backslashes must be doubled so Windows argument parsing does not
+  # treat them as escaping the closing quote
+  body = arg.rstrip('\\')
+  return '"{0}{1}"'.format(body, '\\' * (2 * (len(arg) - len(body))))
+
 # Genrates script for performing a command
 # cmd: Command to be performed
 # msg: What command actually does
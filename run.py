@@ -1,6 +1,7 @@
 #!/usr/bin/python2.7
 
 # Standard python modules
+import codecs
 import io
 import os
 import sys
@@ -9,9 +10,17 @@ from   subprocess import PIPE, Popen, run, STDOUT
 # Local modules
 from announce   import Announce
 
-# Default output filter for the commands below
-def NoFilter(line):
-  out = line.decode('utf-8') if isinstance(line, bytes) else str(line)
+# Most output to read from a command at one time
+# (read1 returns whatever is already available so a large size costs no latency
+#  but lets bursts of output be handled with far fewer filter calls and writes)
+CHUNK_SIZE = 64 * 1024
+
+# Default output filter for FilterCommandAsync
+# line    - Output to be shown
+# decoder - Incremental decoder for the command's output (holds any partial
+#           character until the rest of it arrives with the next output)
+def NoFilter(line, decoder):
+  out = decoder.decode(line) if isinstance(line, bytes) else str(line)
   sys.stdout.write(out)
 
 # Set the directory for command execution
@@ -59,15 +68,18 @@ def RunCommands(executable, commands, directory = None, log=None):
 
 # Execute a command filtering output line-by-line
 # command    - Command to execute
-# filter     - Routine for processing output one line at a time
+# filter     - Routine for processing output one line at a time (None to just show it)
 # directory  - Directory from which to run command
 # log        - File in which to log the output
 # returns the return code of the command that was execuated
-def FilterCommand(command, filter = NoFilter, directory = None, log=None):
+def FilterCommand(command, filter = None, directory = None, log=None):
   # Move to indicated directory
   saved = SetDirectory(directory)
-  # Open log file
-  if log: logFile = open(log, 'w')
+  # Open log file (binary so output is logged exactly as received without decoding)
+  if log: logFile = open(log, 'wb')
+  # Show output as is when no filter given
+  # (whole lines never split a character so a plain decode is enough)
+  if not filter: filter = lambda line: sys.stdout.write(line.decode('utf-8', 'replace'))
   # Execute command in another process
   process = Popen(command.split(' '), stdout=PIPE, stderr=STDOUT)
   # Handle command output
@@ -76,7 +88,7 @@ def FilterCommand(command, filter = NoFilter, directory = None, log=None):
     if not line and process.poll() is not None: break
     if line:
       filter(line)
-      if log: logFile.write(line.decode('utf-8') if type(line) is bytes else line)
+      if log: logFile.write(line)
   returncode = process.poll()
   # Close log file
   if log: logFile.close()
@@ -86,26 +98,36 @@ def FilterCommand(command, filter = NoFilter, directory = None, log=None):
 
 # Execute a command capturing output in real time
 # command    - Command to execute
-# filter     - Routine for processing output one chunk at a time
+# filter     - Routine for processing output one chunk at a time (None to just show it)
 # directory  - Directory from which to run command
 # log        - File in which to log the output
 # returns the return code of the command that was execuated
-def FilterCommandAsync(command, filter = NoFilter, directory = None, log=None):
+def FilterCommandAsync(command, filter = None, directory = None, log=None):
   # Move to indicated directory
   saved = SetDirectory(directory)
-  # Open log file
-  if log: logFile = open(log, 'w')
+  # Open log file (binary so output is logged exactly as received without decoding)
+  if log: logFile = open(log, 'wb')
+  # Show output as is when no filter given
+  # (with a decoder for this command only since a chunk can end partway
+  #  through a character)
+  decoder = None
+  if not filter:
+    decoder = codecs.getincrementaldecoder('utf-8')(errors='replace')
+    filter  = lambda chunk: NoFilter(chunk, decoder)
   # Execute command in another process
   process = Popen(command.split(), stdout=PIPE, stderr=STDOUT)
   # Open command output
   sout = io.open(process.stdout.fileno(), 'rb', closefd=False)
-  # Handle command output
+  # Handle command output until the command closes its end of the pipe
   while True:
-    buffer = sout.read1(1024)
-    if process.poll() != None: break
-    if len(buffer) == 0: continue
+    buffer = sout.read1(CHUNK_SIZE)
+    if len(buffer) == 0: break
     filter(buffer)
     if log: logFile.write(buffer)
+  # Show any partial character still held by the decoder
+  if decoder: sys.stdout.write(decoder.decode(b'', True))
+  # Wait for command to complete (rather than spinning on poll)
+  process.wait()
   # Close log file
   if log: logFile.close()
   # Restore original directory
@@ -30,10 +30,11 @@ def switch():
       print('  Available repositories (currently selected repository has *)')
       print('  vcs repository')
       print('  --- -----------------------------------------------')
+      selected = data.gbl.repo           # Looked up once for the whole list
       for item in repositories.split(';'):
         path = os.path.join(item, '.git')
         vcs  = 'git' if os.path.exists(path) else 'svn'
-        star = '*' if item.lower() == data.gbl.repo else ' '
+        star = '*' if item.lower() == selected else ' '
         print('{0} {1} {2}'.format(star, vcs, item))
     else:
       print('  No repositories (use "bt attach" to add one).')
@@ -3,6 +3,7 @@
 # Standard python modules
 import getpass
 import os
+import stat
 import subprocess
 import sys
 import re
@@ -17,6 +18,15 @@ reIntel = re.compile('(^||/)Intel', re.IGNORECASE)
 reAMD   = re.compile('(^||/)Amd', re.IGNORECASE)
 reArm   = re.compile('(^||/)Arm', re.IGNORECASE)
 
+# Contents of a worktree's .git file: "gitdir: <repoBase>/.git/worktrees/<worktreeSubdirectory>"
+reGitDir = re.compile(r'gitdir:\s*(.+?)[\\/]\.git[\\/]worktrees[\\/]')
+
+DEBUG = 0
+
+# Global data
+WorktreeRepos = { }   # Repository for each worktree whose .git file has been parsed
+VCSProbes     = { }   # VCS directory found (if any) for each directory probed
+
 # Base class for Version Control System (VCS)  
 class VCS:
 
@@ -96,8 +106,8 @@ class VCS:
     os.chdir(self.__base)
     # Execute the command
     process = subprocess.Popen(cmd, stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.STDOUT)
-    # Process command output
-    for line in process.stdout.readlines():
+    # Process command output (as it arrives rather than after the command finishes)
+    for line in process.stdout:
       # Call appropriate handler
       if type(line) is bytes:
         line = line.decode('utf-8')
@@ -107,6 +117,8 @@ class VCS:
       if input:
         # Process the input
         for inp in input: process.stdin.writeline(inp)
+    # Wait for the command to finish so its return code is known
+    process.wait()
     # Switch back
     os.chdir(saved)
     # Return resulting error code
@@ -130,11 +142,9 @@ class VCS:
     if len(lst) == 0:
       print('\nNothing to show!')
     else:
-      # Print header
-      print('\n' + self.__format.format('State', 'Path'))
-      print(self.__format.format('-----', '----'))
-      # Show items
-      for item in lst: print(item)
+      # Print header and items with a single write (rather than one per line)
+      header = [self.__format.format('State', 'Path'), self.__format.format('-----', '----')]
+      print('\n' + '\n'.join(header + lst))
 
   ###########
   # Getters #
@@ -420,12 +430,12 @@ class VCSInfo:
     self.__listed = isListed
     base          = vcs.Base()
     self.__branch = None
+    self.__looked = isRepo    # Worktree branch is only looked up when asked for
     # Handle repo
     if isRepo:
       self.__repo = base
     else:
-      self.__branch = GetBranchFromWorktree(base)
-      self.__repo   = GetRepoFromWorktree(base)
+      self.__repo = GetRepoFromWorktree(base)
 
   ###########
   # Getters #
@@ -454,6 +464,10 @@ class VCSInfo:
   # Get the branch the repository is using
   # returns repository branch
   def Branch(self):
+    # Running "git branch" is costly so it is not done until needed
+    if not self.__looked:
+      self.__branch = GetBranchFromWorktree(self.__vcs.Base())
+      self.__looked = True
     return self.__branch
 
 #####################
@@ -465,16 +479,8 @@ class VCSInfo:
 # base:   VCS directory for which to look
 # returns True if VCS directory is in the list, False otherwise
 def __FoundInList(lst, base):
-  found = False   # Assume not attached
-  # Loop through attached items
-  for item in lst:
-    # Is it in the list?
-    if item == base:
-      # Yes, done!
-      found = True
-      break
-  # Return results
-  return found
+  # Let the list do the search rather than looping in python
+  return base in lst
 
 # See if VCS is attached where VCS can be only part of the base directory
 # lst:    List of avaialble repositories or worktrees
@@ -493,6 +499,8 @@ def __DetectPartialAttached(lst, base, kind):
     if base in item:
       # Yes, save it
       found.append(item)
+      # A second match already makes it ambiguous (no need to look further)
+      if len(found) > 1: break
   # Handle what was found
   cnt = len(found)
   if cnt > 1:
@@ -505,6 +513,27 @@ def __DetectPartialAttached(lst, base, kind):
   # Return results
   return result
 
+# Look for a VCS directory in a directory
+# base:   Full path of directory to check
+# returns (VCS directory name, True if it is a directory) if found, None otherwise
+def __ProbeVCS(base):
+  # Each directory only needs to be probed once
+  if base in VCSProbes: return VCSProbes[base]
+  found = None  # Assume neither
+  # Look for git, or svn VCS
+  for dir in ('.git', '.svn'):
+    # See if VCS directory exists
+    # (a single stat answers both "does it exist" and "is it a directory")
+    path = os.path.join(base, dir)
+    try:
+      mode = os.stat(path).st_mode
+    except OSError:
+      continue
+    found = (dir, stat.S_ISDIR(mode))
+    break
+  VCSProbes[base] = found
+  return found
+
 # Find root of a VCS directory from a full path
 # lst:    List of attached VCS items
 # base:   Full path to check for VCS
@@ -512,21 +541,18 @@ def __DetectPartialAttached(lst, base, kind):
 #         if base is in a worktree:   VCSInfo with isRepo = False
 #         if base is in neither:      None
 def __FindVCS(lst, base):
-  info = None   # Assume neither
-  # Look for git, or svn VCS
-  for dir in ('.git', '.svn'):
-    # See if VCS directory exists
-    path = os.path.join(base, dir)
-    if os.path.exists(path):
-      # For repos path is directory, for worktrees path is a file
-      isRepo = os.path.isdir(path)
-      vcs    = svnVCS(base) if dir == '.svn' else gitVCS(base)
-      info   = VCSInfo(vcs, isRepo, __FoundInList(lst, base))
-      break
+  info  = None   # Assume neither
+  found = __ProbeVCS(base)
+  if found:
+    # For repos path is directory, for worktrees path is a file
+    dir, isRepo = found
+    vcs    = svnVCS(base) if dir == '.svn' else gitVCS(base)
+    info   = VCSInfo(vcs, isRepo, __FoundInList(lst, base))
   else:
     # Try up one level
-    oneup = os.path.abspath(os.path.join(base, '..'))
-    if not oneup == os.path.abspath(base):
+    # (base is always absolute here so dirname avoids re-resolving it against cwd)
+    oneup = os.path.dirname(base)
+    if not oneup == base:
       info = __FindVCS(lst, oneup)
   # Return results
   return info
@@ -585,7 +611,7 @@ def __CheckExpected(given, info, kind):
 def UpdateRepos():
   repositories = ';'.join(data.gbl.repos)
   data.gbl.SetItem('repositories', repositories)
-  print('data.gbl.repositories = {0}'.format(repositories))
+  if (DEBUG): print('data.gbl.repositories = {0}'.format(repositories))
 
 # Get VCS information from full or partial path
 # lst:    List of repositories or worktrees
@@ -698,11 +724,13 @@ def GetBranchFromWorktree(base):
 # returns Branch on which worktree is based
 def DoesBranchExist(repo, branch):
    found = False
+   # Compile the pattern once rather than for every line of output
+   reBranch = re.compile('. {0}'.format(branch))
    def FindBranch(line):
      nonlocal found
      # Convert bytes to string (is needed)
      if isinstance(line, bytes): line = line.decode('utf-8')
-     result = re.match('. {0}'.format(branch), line.strip())
+     result = reBranch.match(line.strip())
      if result:
        found = True
    FilterCommand('git branch', FindBranch, repo)
@@ -712,52 +740,43 @@ def DoesBranchExist(repo, branch):
 # base: Base directory of the worktree
 # returns Repository from which a worktree was created, DOES NOT RETURN  otherwise
 def GetRepoFromWorktree(base):
+  # The .git file of a worktree only needs to be parsed once
+  if base in WorktreeRepos: return WorktreeRepos[base]
+
   # Information is in the file named <base>.git
   git  = os.path.join(base, '.git')
-  path = None
 
   # For this to be a worktree, this must be a file (not a directory)
-  if os.path.isfile(git):
-    # Read the worktree file
-    #    where pathToWorktreeInfo looks like this:
-    #    <repoBaseDirectory>/.git/<worktreeSubdirectory>
-    try:
-      with open(git, 'r') as info:
-        # Get the worktree info
-        data = info.readline()
-        # Should be of the following format:
-        #   gitdir: <pathToWorkteeInfo>
-        # Error opening or reading from worktree info file
-    except OSError:
-      raise NotAWorktree(base)
-      #DOES NOT RETURN
-
-    # Split off the "gitdir" portion
-    data = data.split(' ')
-    # There should be exactly 2 items here
-    if len(data) != 2:
-      raise NotAWorktree(base)
-      #DOES NOT RETURN
-    # Right side of the split should be of the format
-    # "<repoBase>/.git/<worktreeSubdirectory>
-
-    # Split off the repo base
-    data = data[1].split('.')
-    # There should be exactly 2 items here
-    if len(data) != 2:
-      raise NotAWorktree(base)
-      #DOES NOT RETURN
-
-    # Save repo base
-    path = data[0]
-
-  # Not a worktree
-  else:
+  # (just try to read it, opening a directory or a missing file fails anyway)
+  # Read the worktree file
+  #    where pathToWorktreeInfo looks like this:
+  #    <repoBaseDirectory>/.git/<worktreeSubdirectory>
+  try:
+    with open(git, 'r') as info:
+      # Get the worktree info
+      data = info.readline()
+      # Should be of the following format:
+      #   gitdir: <pathToWorkteeInfo>
+      # Error opening or reading from worktree info file
+  except OSError:
     raise NotAWorktree(base)
-    # DOES NOT RETURN
+    #DOES NOT RETURN
+
+  # Split off the "gitdir" portion and the repo base in a single match
+  # (repo paths may contain spaces or periods)
+  match = reGitDir.match(data)
+  if not match:
+    raise NotAWorktree(base)
+    #DOES NOT RETURN
+
+  # Path may be relative to the worktree (git 2.48+ with worktree.useRelativePaths)
+  repo = match.group(1)
+  if not os.path.isabs(repo):
+    repo = os.path.normpath(os.path.join(base, repo))
 
-  # Return repo path
-  return path[:-1]
+  # Remember and return repo path
+  WorktreeRepos[base] = repo
+  return WorktreeRepos[base]
 
 # Automatically select a repository
 # returns nothing
@@ -779,15 +798,15 @@ def AutoSelectRepo(show):
 # worktree: Partial pathname of worktree to locate
 # retruns   Full pathname or None if not found
 def FindWorkTreeFromPartialPath(partial):
+  # Worktrees and repos are already stored in lowercase (see InitializeSettings)
   target = partial.lower()
   found  = []
   for worktree in data.gbl.worktrees:   # Loop through worktrees
-    match = worktree.lower()
     # See if partial path matches this worktree exactly
-    if match.startswith(target):
+    if worktree.startswith(target):
       return worktree
     # See if partail path is part of worktree
-    if target in match:
+    if target in worktree:
       found.append(worktree)
   # Was something found?
   if found:
@@ -798,12 +817,11 @@ def FindWorkTreeFromPartialPath(partial):
     return found[0]
   # If not found in worktrees check repositories
   for repo in data.gbl.repos:          # Loop through repos
-    match = repo.lower()
     # See if partial path matches this repo exactly
-    if target.startswith(match):
+    if target.startswith(repo):
       return repo
     # See if partail path is part of repo
-    if target in match:
+    if target in repo:
       found.append(repo)
   # Was something found?
   if found: